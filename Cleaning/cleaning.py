@@ -1,10 +1,140 @@
 import pandas as pd
 import xml.etree.ElementTree as ET
-import json
+import orjson
+import csv
 import os
 import numpy as np
 import re
 import string
+import openpyxl
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from collections.abc import Iterator, Mapping
+from itertools import islice
+from functools import partial
+from types import MappingProxyType
+
+CHUNK_SIZE = 200_000
+
+ARROW_STRING_TYPES = {pa.string(): pd.StringDtype('pyarrow'), pa.large_string(): pd.StringDtype('pyarrow')}
+
+
+# Marker converters used in the schemas below; `split_converters` groups columns by identity
+# against them and the actual conversion is done column-wise in `cast_columns`.
+_NUMERIC = partial(pd.to_numeric, errors='coerce')
+_DATETIME = partial(pd.to_datetime, errors='coerce')
+
+_TAG_CONVERTERS = MappingProxyType({
+    'id_log': str,
+    'carrinho': str,
+    'transactionid': str,
+    'plataform': str,
+    'storeid': str,
+    'nm_brand': str,
+    'nm_category_l5': str,
+    'ean': str,
+    'nm_manufacturer': str,
+    'mktsaleid': str,
+    'productname': str,
+    'sku': str,
+    'nm_subbrand': str,
+    'value': str,
+    'zipcode': str,
+    'gender': str,
+    'productcondition': str,
+    'quantity': str,
+    #numeric columns
+    'deliverytax': _NUMERIC,
+    'deliverytime': _NUMERIC,
+    'deliverytype': _NUMERIC,
+    'parcels': _NUMERIC,
+    'paymenttype': _NUMERIC,                
+    'cardflag': _NUMERIC,
+    'invoiceemissor': _NUMERIC,
+    'totalspent': _NUMERIC,
+    #datetime columns
+    'datacomp': _DATETIME,
+    'birthday': _DATETIME                   
+})
+
+_API_CONVERTERS = MappingProxyType({
+    'id_api_hit': str,
+    'id_store': str,
+    'id_transaction': str,
+    'dt_transaction': _DATETIME,
+    'nm_platform': str,
+    'nm_gender': str,
+    'cd_zipcode': str,
+    'qt_parcel': _NUMERIC,                                
+    'vl_totalspent': _NUMERIC,
+    'cd_paymenttype': _NUMERIC,
+    'cd_cardflag': _NUMERIC,
+    'cd_invoiceemissor': _NUMERIC,
+    'nm_age': _NUMERIC, 
+    'nm_birthday': _DATETIME,
+    'nm_lastmile': _NUMERIC,
+    'id_log': str,
+    'dt_process_header': _DATETIME,
+    'dt_process_detail': _DATETIME,
+    'dt_import':  _DATETIME,
+    'cd_sku': str,
+    'cd_ean': str,
+    'nm_product': str,
+    'vl_product': _NUMERIC,
+    'qt_product': _NUMERIC,
+    'cd_productcondition': _NUMERIC,
+    'nm_deliverytype': _NUMERIC,
+    'vl_deliverytax': _NUMERIC,
+    'qt_deliverytime': _NUMERIC,
+    'nm_mktsaleid': str,
+    'nm_model': str,
+    'nm_manufacturer': str,
+    'nm_brand': str,
+    'nm_subbrand': str,
+    'nm_catl1': str,
+    'nm_catl2': str,
+    'nm_catl3': str,
+    'nm_catl4': str,
+    'nm_catl5': str,
+    'tx_fulldescription': str,
+    'tx_fullpath': str,
+    'cd_pack': _NUMERIC,
+    'cd_promo': _NUMERIC,
+    'cd_ownbrand': _NUMERIC,
+    'cd_intll': _NUMERIC,
+    'nm_origin': str 
+})
+
+_AMAZON_CONVERTERS = MappingProxyType({
+    'asin' : str,
+    'ean1' : str,
+    'dest_country' : str,
+    'item_name': str,
+    'source_country':str,
+    'date': _DATETIME,
+    'date_granularity': str,
+    'business_group': str,
+    'postal_code': str,
+    'base_currency_code': str,
+    'our_price': float,
+    'distinct_order_count': float,
+    'shipped_units' : float,
+    'shipped_sales': float,
+    'shipped_sales_w_tax': float,
+    'shipped_sales_after_discount': float,
+    'shipped_sales_w_tax_after_discount': float,
+    'promotion': str
+
+})
+
+_CONVERTERS = MappingProxyType({
+    'TAG': _TAG_CONVERTERS,
+    'API': _API_CONVERTERS,
+    'AMAZON': _AMAZON_CONVERTERS,
+})
+
+_NO_CONVERTERS = MappingProxyType({})
+
 
 class DataProcessor:
     """
@@ -49,7 +179,7 @@ class DataProcessor:
 
         return self.file_type
 
-    def process_file(self) -> pd.DataFrame:
+    def process_file(self, stream: bool = False) -> pd.DataFrame | Iterator[pd.DataFrame]:
         """
         Processes the file based on its extension and returns a cleaned DataFrame.
 
@@ -59,10 +189,21 @@ class DataProcessor:
             - JSON
             - Excel (.xls, .xlsx)
 
-        The method identifies the file type by checking specific column names and applies appropriate converters if needed.
+        The method identifies the file type by checking specific column names, reads text columns directly as
+        strings and casts numeric and datetime columns in a single vectorized pass after loading.
+
+        CSV files are parsed with the multithreaded `pyarrow.csv` reader; text columns stay Arrow-backed. When `stream`
+        is set, CSV and .xlsx files are instead read in chunks of `CHUNK_SIZE` rows so that only one chunk
+        is held in memory at a time (the pyarrow engine does not support `chunksize`, so streamed CSVs use
+        the C engine). Excel workbooks are parsed with the Rust-based calamine engine rather than building an
+        openpyxl tree. JSON is parsed with orjson and typed with the same schema as CSV and Excel. Other
+        formats are returned as a single chunk.
+
+        Args:
+            stream (bool): If True, returns an iterator of cleaned DataFrame chunks instead of a single DataFrame.
 
         Returns:
-            pandas.DataFrame: A DataFrame containing the processed data with empty strings replaced by `pd.NA`.
+            pandas.DataFrame or Iterator[pandas.DataFrame]: The processed data with empty strings replaced by `pd.NA`.
 
         Raises:
             ValueError: If the file format is not supported.
@@ -70,38 +211,48 @@ class DataProcessor:
         file_extension = os.path.splitext(self.file_path)[1].lower()
         
         if file_extension == '.csv':            
-            headers = pd.read_csv(self.file_path, nrows=0)            
-            if 'id_api_hit'.lower() in headers.columns or 'dt_transaction'.lower() in headers.columns:
-                converters = self.get_converters('API')
-            elif 'id_log'.lower() in headers.columns or 'datacomp'.lower() in headers.columns: 
-                converters = self.get_converters('TAG') 
+            header = self.read_header(file_extension)
+            converters = self.select_converters(header)
+            string_cols, numeric_cols, datetime_cols = self.split_converters(converters)
+            if stream:
+                reader = pd.read_csv(self.file_path, dtype={col: 'string[pyarrow]' for col in string_cols}, chunksize=CHUNK_SIZE, engine='c')
+                return self.iter_chunks(reader, string_cols, numeric_cols, datetime_cols)
 
-            df = pd.read_csv(self.file_path, converters=converters)            
+            # pd.read_csv(engine='pyarrow') applies `dtype` only after Arrow inferred the column types, which would
+            # drop leading zeros from numeric-looking text (zipcodes, EANs, ids); declare them to the Arrow reader instead
+            convert_options = pa_csv.ConvertOptions(column_types={col: pa.string() for col in string_cols if col in header})
+            # only text maps to an Arrow-backed dtype, so columns get the same dtypes as from the other readers
+            df = pa_csv.read_csv(self.file_path, convert_options=convert_options).to_pandas(types_mapper=ARROW_STRING_TYPES.get)
+            df = self.cast_columns(df, string_cols, numeric_cols, datetime_cols)
         
         elif file_extension == '.xml':
-            tree = ET.parse(self.file_path)
-            root = tree.getroot()
-            data = []
-            for item in root:
-                row = {}
-                for child in item:
-                    row[child.tag] = child.text
-                data.append(row)
-            df = pd.DataFrame(data)            
+            df = pd.DataFrame(self.read_xml_columns(), copy=False)
         
         elif file_extension == '.json':
-            with open(self.file_path, 'r') as file:
-                data = json.load(file)
-            df = pd.DataFrame(data)            
+            with open(self.file_path, 'rb') as file:
+                data = orjson.loads(file.read())
+            df = pd.DataFrame(data, dtype=object)
+            del data
+
+            # schema text columns are cast from the raw values, so JSON numbers keep their form ('1234', not the
+            # '1234.0' a column inferred as float64 because of a null would give); the rest is inferred as usual
+            string_cols, numeric_cols, datetime_cols = self.split_converters(self.select_converters(list(df.columns)))
+            inferred_cols = df.columns.difference(string_cols)
+            if len(inferred_cols):
+                df[inferred_cols] = df[inferred_cols].infer_objects()
+            df = self.cast_columns(df, string_cols, numeric_cols, datetime_cols)
         
         elif file_extension in ['.xls', '.xlsx']:
-            headers = pd.read_excel(self.file_path, nrows=0)            
-            if 'id_api_hit'.lower() in headers.columns or 'dt_transaction'.lower() in headers.columns:
-                converters = self.get_converters('API')
-            elif 'id_log'.lower() in headers.columns or 'datacomp'.lower() in headers.columns: 
-                converters = self.get_converters('TAG') 
+            converters = self.select_converters(self.read_header(file_extension))
+            string_cols, numeric_cols, datetime_cols = self.split_converters(converters)
+            if stream and file_extension == '.xlsx':
+                reader = self.read_excel_chunks(CHUNK_SIZE)
+                return self.iter_chunks(reader, string_cols, numeric_cols, datetime_cols)
 
-            df = pd.read_excel(self.file_path, converters=converters)
+            # no dtype_backend='pyarrow': it converts each column to Arrow from its inferred type before applying `dtype`,
+            # which fails on text columns mixing number and text cells (ids, zipcodes, EANs)
+            df = pd.read_excel(self.file_path, dtype={col: 'string[pyarrow]' for col in string_cols}, engine='calamine')
+            df = self.cast_columns(df, string_cols, numeric_cols, datetime_cols)
 
         elif file_extension == 'txt000':
             headers = pd.read_csv(self.file_path, sep= "|",nrows = 0)
@@ -110,129 +261,234 @@ class DataProcessor:
         else:
             raise ValueError("Unsupported file format")
         
-        df = df.replace('', pd.NA)
+        df = self.blank_to_na(df)
+        return iter([df]) if stream else df
+
+    def iter_chunks(self, reader, string_cols: list, numeric_cols: list, datetime_cols: list) -> Iterator[pd.DataFrame]:
+        """
+        Casts and cleans each chunk produced by a chunked reader.
+
+        Args:
+            reader (Iterable[pandas.DataFrame]): The raw chunks.
+            string_cols (list): Columns to store as Arrow-backed strings.
+            numeric_cols (list): Columns to convert with `pd.to_numeric`.
+            datetime_cols (list): Columns to convert with `pd.to_datetime`.
+
+        Yields:
+            pandas.DataFrame: A typed chunk with empty strings replaced by `pd.NA`.
+        """
+        for chunk in reader:
+            chunk = self.cast_columns(chunk, string_cols, numeric_cols, datetime_cols)
+            yield self.blank_to_na(chunk)
+
+    def blank_to_na(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces empty strings with `pd.NA` in the text columns of a DataFrame.
+
+        Only object and string columns are scanned, since numeric and datetime columns cannot hold
+        empty strings; the comparison runs column by column, in Arrow for Arrow-backed strings.
+
+        Args:
+            df (pandas.DataFrame): The DataFrame to clean.
+
+        Returns:
+            pandas.DataFrame: The DataFrame with empty strings replaced by `pd.NA`.
+        """
+        for col, dtype in df.dtypes.items():
+            if not pd.api.types.is_string_dtype(dtype):
+                continue
+            empty = (df[col] == '').to_numpy(dtype=bool, na_value=False)
+            if empty.any():
+                df[col] = df[col].mask(empty, pd.NA)
         return df
 
-    def get_converters(self, type: str) -> dict:
+    def read_xml_columns(self) -> dict:
+        """
+        Streams an XML file into a dictionary of column lists.
+
+        Each direct child of the root element is a row and each of its children a field. Rows are
+        parsed with `ET.iterparse` and cleared as soon as they are consumed, so memory stays bound by
+        the size of the columns rather than the whole document tree. Fields missing from a row are
+        filled with None, as `pd.DataFrame` does for a list of dicts.
+
+        Returns:
+            dict: A mapping of field tag to the list of its values, in order of first appearance.
         """
-        Returns a dictionary of column converters based on the file type.
+        cols = {}
+        n_rows = 0
+        depth = 0
+        root = None
+        for event, elem in ET.iterparse(self.file_path, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if root is None:
+                    root = elem
+                continue
+
+            depth -= 1
+            if depth != 1:
+                continue
+
+            row = {child.tag: child.text for child in elem}
+            for tag in row:
+                if tag not in cols:
+                    cols[tag] = [None] * n_rows
+            for tag, values in cols.items():
+                values.append(row.get(tag))
+            n_rows += 1
+
+            elem.clear()
+            root.clear()
+
+        return cols
+
+    def read_excel_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Reads the first sheet of an .xlsx workbook in chunks using openpyxl's read-only mode.
+
+        `pd.read_excel` has no `chunksize`, so rows are pulled lazily from the worksheet and grouped
+        into DataFrames of at most `chunksize` rows. The first row is used as the header.
+
+        Args:
+            chunksize (int): The maximum number of rows per chunk.
+
+        Yields:
+            pandas.DataFrame: A chunk of raw rows with a continuous index across chunks.
+        """
+        wb = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            rows = wb.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+
+            start = 0
+            while batch := list(islice(rows, chunksize)):
+                chunk = pd.DataFrame(batch, columns=header, index=range(start, start + len(batch)))
+                start += len(batch)
+                yield chunk
+        finally:
+            wb.close()
+
+    def read_header(self, file_extension: str) -> list:
+        """
+        Reads only the column names of a CSV or Excel file.
+
+        CSV headers come from the first line through the `csv` module and .xlsx headers from the first
+        row of openpyxl's read-only worksheet, so neither requires parsing the data rows. Legacy .xls
+        workbooks fall back to `pd.read_excel(nrows=0)`.
+
+        Args:
+            file_extension (str): The lowercase file extension, including the dot.
+
+        Returns:
+            list: The column names, or an empty list if the file has no header row.
+        """
+        if file_extension == '.csv':
+            with open(self.file_path, 'r', newline='', encoding='utf-8-sig') as file:
+                return next(csv.reader(file), [])
+
+        if file_extension == '.xlsx':
+            wb = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+            try:
+                header = next(wb.worksheets[0].iter_rows(max_row=1, values_only=True), ())
+            finally:
+                wb.close()
+            return [col for col in header if col is not None]
+
+        return list(pd.read_excel(self.file_path, nrows=0, engine='calamine').columns)
+
+    def select_converters(self, columns: list) -> Mapping:
+        """
+        Picks the converter schema matching a file's column names.
+
+        Args:
+            columns (list): The column names read from the file header.
+
+        Returns:
+            Mapping: The read-only 'API' or 'TAG' converter schema, or an empty mapping if neither matches.
+        """
+        if 'id_api_hit' in columns or 'dt_transaction' in columns:
+            return self.get_converters('API')
+        elif 'id_log' in columns or 'datacomp' in columns:
+            return self.get_converters('TAG')
+        return _NO_CONVERTERS
+
+    def split_converters(self, converters: Mapping) -> tuple[list, list, list]:
+        """
+        Splits a converter schema into string, numeric and datetime column lists.
+
+        Args:
+            converters (Mapping): A converter schema as returned by `get_converters`.
+
+        Returns:
+            tuple[list, list, list]: The string, numeric and datetime column names.
+        """
+        string_cols = [col for col, conv in converters.items() if conv is str]
+        numeric_cols = [col for col, conv in converters.items() if conv is _NUMERIC or conv is float]
+        datetime_cols = [col for col, conv in converters.items() if conv is _DATETIME]
+        return string_cols, numeric_cols, datetime_cols
+
+    def cast_columns(self, df: pd.DataFrame, string_cols: list, numeric_cols: list, datetime_cols: list) -> pd.DataFrame:
+        """
+        Casts the columns of a loaded DataFrame using vectorized pandas conversions.
+
+        Text columns are stored as `pd.StringDtype('pyarrow')` whatever dtype the reader produced (object,
+        Python strings or `pd.ArrowDtype(pa.string())`), so validations always see one dtype; its contiguous
+        UTF-8 buffer replaces one Python object per cell and `.str` operations run in Arrow. Columns listed in the schema but missing
+        from the DataFrame are ignored, and values that cannot be converted are coerced to NaN/NaT.
+
+        Datetime columns are parsed with `format='mixed'`, so each value's format is inferred on its own
+        like the former per-cell converters did. A single inferred format (pandas' default) would turn
+        every value in another layout into NaT, e.g. `2024-01-05 13:22:10` in a column whose first value
+        is `2024-01-05`, and streamed chunks could each infer a different one.
+
+        Args:
+            df (pandas.DataFrame): The DataFrame to cast.
+            string_cols (list): Columns to store as Arrow-backed strings.
+            numeric_cols (list): Columns to convert with `pd.to_numeric`.
+            datetime_cols (list): Columns to convert with `pd.to_datetime`.
+
+        Returns:
+            pandas.DataFrame: The DataFrame with the typed columns.
+        """
+        string_cols = [
+            col for col in string_cols
+            if col in df.columns and not (isinstance(df[col].dtype, pd.StringDtype) and df[col].dtype.storage == 'pyarrow')
+        ]
+        if string_cols:
+            df[string_cols] = df[string_cols].astype('string[pyarrow]')
+
+        numeric_cols = [col for col in numeric_cols if col in df.columns]
+        if numeric_cols:
+            df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce')
+
+        for col in datetime_cols:
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], errors='coerce', format='mixed', cache=True)
+
+        return df
+
+    def get_converters(self, type: str) -> Mapping:
+        """
+        Returns the column converters for the file type.
 
         The converters ensure that specific columns are read with the correct data types,
         such as strings, numerics, or datetimes. This helps standardize data ingestion
-        across different file formats and schemas.
+        across different file formats and schemas. The schemas are module-level constants
+        built once at import and returned as read-only mappings, so no caller can alter the
+        schema used for later files.
 
         Args:
-            type (str): The type of the file. Must be either 'TAG' or 'API'.
+            type (str): The type of the file. Must be 'TAG', 'API' or 'AMAZON'.
 
         Returns:
-            dict: A dictionary mapping column names to conversion functions or types.
+            Mapping: A read-only mapping of column names to conversion functions or types.
 
         Raises:
             ValueError: If the provided file type is not recognized.
         """
 
-        if type == 'TAG':
-            return {
-                'id_log': str,
-                'carrinho': str,
-                'transactionid': str,
-                'plataform': str,
-                'storeid': str,
-                'nm_brand': str,
-                'nm_category_l5': str,
-                'ean': str,
-                'nm_manufacturer': str,
-                'mktsaleid': str,
-                'productname': str,
-                'sku': str,
-                'nm_subbrand': str,
-                'value': str,
-                'zipcode': str,
-                'gender': str,
-                'productcondition': str,
-                'quantity': str,
-                #numeric columns
-                'deliverytax': lambda x : pd.to_numeric(x, errors='coerce'),
-                'deliverytime': lambda x : pd.to_numeric(x, errors='coerce'),
-                'deliverytype': lambda x : pd.to_numeric(x, errors='coerce'),
-                'parcels': lambda x : pd.to_numeric(x, errors='coerce'),
-                'paymenttype': lambda x : pd.to_numeric(x, errors='coerce'),                
-                'cardflag': lambda x : pd.to_numeric(x, errors='coerce'),
-                'invoiceemissor': lambda x : pd.to_numeric(x, errors='coerce'),
-                'totalspent': lambda x : pd.to_numeric(x, errors='coerce'),
-                #datetime columns
-                'datacomp': lambda x: pd.to_datetime(x, errors='coerce'),
-                'birthday': lambda x: pd.to_datetime(x, errors='coerce')                   
-            }
-        elif type == 'API':
-            return {
-                'id_api_hit': str,
-                'id_store': str,
-                'id_transaction': str,
-                'dt_transaction': lambda x: pd.to_datetime(x, errors='coerce'),
-                'nm_platform': str,
-                'nm_gender': str,
-                'cd_zipcode': str,
-                'qt_parcel': lambda x: pd.to_numeric(x, errors='coerce'),                                
-                'vl_totalspent': lambda x: pd.to_numeric(x, errors='coerce'),
-                'cd_paymenttype': lambda x: pd.to_numeric(x, errors='coerce'),
-                'cd_cardflag': lambda x: pd.to_numeric(x, errors='coerce'),
-                'cd_invoiceemissor': lambda x: pd.to_numeric(x, errors='coerce'),
-                'nm_age': lambda x: pd.to_numeric(x, errors='coerce'), 
-                'nm_birthday': lambda x: pd.to_datetime(x, errors='coerce'),
-                'nm_lastmile': lambda x: pd.to_numeric(x, errors='coerce'),
-                'id_log': str,
-                'dt_process_header': lambda x: pd.to_datetime(x, errors='coerce'),
-                'dt_process_detail': lambda x: pd.to_datetime(x, errors='coerce'),
-                'dt_import':  lambda x: pd.to_datetime(x, errors='coerce'),
-                'cd_sku': str,
-                'cd_ean': str,
-                'nm_product': str,
-                'vl_product': lambda x : pd.to_numeric(x, errors='coerce'),
-                'qt_product': lambda x: pd.to_numeric(x, errors='coerce'),
-                'cd_productcondition': lambda x: pd.to_numeric(x, errors='coerce'),
-                'nm_deliverytype': lambda x: pd.to_numeric(x, errors='coerce'),
-                'vl_deliverytax': lambda x: pd.to_numeric(x, errors='coerce'),
-                'qt_deliverytime': lambda x: pd.to_numeric(x, errors='coerce'),
-                'nm_mktsaleid': str,
-                'nm_model': str,
-                'nm_manufacturer': str,
-                'nm_brand': str,
-                'nm_subbrand': str,
-                'nm_catl1': str,
-                'nm_catl2': str,
-                'nm_catl3': str,
-                'nm_catl4': str,
-                'nm_catl5': str,
-                'tx_fulldescription': str,
-                'tx_fullpath': str,
-                'cd_pack': lambda x: pd.to_numeric(x, errors='coerce'),
-                'cd_promo': lambda x: pd.to_numeric(x, errors='coerce'),
-                'cd_ownbrand': lambda x: pd.to_numeric(x, errors='coerce'),
-                'cd_intll': lambda x: pd.to_numeric(x, errors='coerce'),
-                'nm_origin': str 
-            }
-        elif type == 'AMAZON':
-            return {
-                'asin' : str,
-                'ean1' : str,
-                'dest_country' : str,
-                'item_name': str,
-                'source_country':str,
-                'date': lambda x: pd.to_datetime(x,errors='coerce'),
-                'date_granularity': str,
-                'business_group': str,
-                'postal_code': str,
-                'base_currency_code': str,
-                'our_price': float,
-                'distinct_order_count': float,
-                'shipped_units' : float,
-                'shipped_sales': float,
-                'shipped_sales_w_tax': float,
-                'shipped_sales_after_discount': float,
-                'shipped_sales_w_tax_after_discount': float,
-                'promotion': str
-
-            }
-        else:
-            raise ValueError(f"File type unknown: {type}")
\ No newline at end of file
+        if type not in _CONVERTERS:
+            raise ValueError(f"File type unknown: {type}")
+        return _CONVERTERS[type]
@@ -2,8 +2,11 @@ import pandas as pd
 from Cleaning.cleaning import DataProcessor
 from Configs import Configs
 import datetime
+import xlsxwriter
 import os
-import numpy as pd  
+from pathlib import PurePath
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 
 output_folder = Configs.output_folder
 if not os.path.exists(output_folder):
@@ -11,6 +14,29 @@ if not os.path.exists(output_folder):
 
 timestamp = datetime.datetime.today().strftime('%Y-%m-%d_%H%M%S')
 
+SHEET_BLOCK_SIZE = 10_000
+
+# payload values xlsxwriter cannot write natively (nested JSON, pandas scalars, MultiIndex headers);
+# they are written as text, as `DataFrame.to_excel` did
+TEXT_FALLBACK_TYPES = (list, tuple, dict, set, frozenset, bytes, np.ndarray, pd.Period, pd.Interval)
+
+
+def write_as_text(worksheet, row, col, token, cell_format=None):
+    """
+    Writes a cell value as its string representation. Registered as an xlsxwriter write handler.
+
+    Args:
+        worksheet (xlsxwriter.worksheet.Worksheet): The sheet being written.
+        row (int): The zero-indexed row.
+        col (int): The zero-indexed column.
+        token (object): The value to write.
+        cell_format (xlsxwriter.format.Format, optional): The cell format.
+
+    Returns:
+        int: The xlsxwriter status code.
+    """
+    return worksheet.write_string(row, col, str(token), cell_format)
+
 class Validations_TAG:
     """
     Handles validation logic for TAG-type data files.
@@ -23,15 +49,21 @@ class Validations_TAG:
         df (pandas.DataFrame): The input data to be validated.
         file_path (str): The path to the input file.
         etailer_name (str): The name of the eTailer, extracted from the file name.
-        output_dict (dict): A dictionary to store intermediate or final validation outputs.
+        _names (list): The label of each validation, in execution order.
+        _counts (list): The number of occurrences found by each validation.
+        _payloads (list): The output of each validation (a DataFrame sample or an error message).
+        _types (list): The type of each validation (e.g. 'Conformity', 'Info' or 'Error').
         raw_data (pandas.DataFrame): A copy of the original input data.
     """
 
     def __init__(self,df,file_path:str):
         self.df = df
         self.file_path = file_path
-        self.etailer_name = self.file_path.split('/')[-1].split('.')[0]
-        self.output_dict = {}
+        self.etailer_name = PurePath(str(self.file_path)).stem
+        self._names = []
+        self._counts = []
+        self._payloads = []
+        self._types = []
         self.raw_data = df
         self.run_methods()
 
@@ -41,16 +73,17 @@ class Validations_TAG:
 
         This method:
         - Iterates through a list of validation and analysis methods.
-        - Applies each method to the raw dataset (`self.raw_data`).
+        - Applies each method to the raw dataset (`self.raw_data`) on a thread pool; each method
+          only reads the data and returns its `(name, occurrences, payload, validation type)` result.
         - Catches and logs any exceptions that occur during method execution.
-        - Stores the results or error messages in the output dictionary.
-        - Sorts the output dictionary by index for organized access.
+        - Collects the futures in submission order, appending the results or error messages to the
+          result lists so they follow the method list without any sorting.
 
         Args:
             None: The method uses `self.raw_data` internally.
 
         Returns:
-            None: All results are stored in `self.output_dict`.
+            None: All results are stored in `self._names`, `self._counts`, `self._payloads` and `self._types`.
         """
 
         df_raw = self.raw_data
@@ -96,16 +129,21 @@ class Validations_TAG:
 """
         ]
 
-        for index, method in enumerate(methods, start=0):
-            try:
-                method(df_raw)
-            except Exception as e:
-                self.output_dict[index] = [method.__name__, df_raw.shape[0], str(e), 'Error']
-        self.output_dict = dict(sorted(self.output_dict.items())) 
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [(method, executor.submit(method, df_raw)) for method in methods]
+            for method, future in futures:
+                try:
+                    name, count, payload, vtype = future.result()
+                except Exception as e:
+                    name, count, payload, vtype = method.__name__, df_raw.shape[0], str(e), 'Error'
+                self._names.append(name)
+                self._counts.append(count)
+                self._payloads.append(payload)
+                self._types.append(vtype)
 
     def export_to_excel(self) -> None:
         """
-        Exports the validation results stored in `self.output_dict` to a formatted Excel file.
+        Exports the validation results stored in the result lists to a formatted Excel file.
 
         Export logic:
         - Creates an Excel file named using the etailer name and timestamp.
@@ -115,9 +153,10 @@ class Validations_TAG:
         - Number of occurrences
         - Validation types
         - Hyperlinks to individual validation sheets
-        - Applies custom formatting to headers, cells, and conditional formatting based on validation type.
-        - Writes individual sheets for each validation, including either the DataFrame output or error message.
-        - Adds a "Back to Summary" link on each sheet for easy navigation.
+        - Applies custom formatting to headers and cells, colouring each validation type cell by its type.
+        - Writes every sheet row by row in xlsxwriter's constant_memory mode, so memory stays flat regardless of payload size.
+        - Writes individual sheets for each validation, including either the DataFrame output (without its index) or error message.
+        - Adds a "Back to Summary" link above the table on each sheet for easy navigation.
 
         This method provides a structured and visually enhanced Excel report for reviewing validation results.
 
@@ -125,77 +164,89 @@ class Validations_TAG:
             None: The Excel file is saved to the specified output folder.
         """
 
-        with pd.ExcelWriter(output_folder + self.etailer_name + f'{timestamp}' + '.xlsx', engine='xlsxwriter') as writer:
-            summary_data = {
-                'INDEX': list(self.output_dict.keys()),
-                'Validation': [value[0] for value in self.output_dict.values()],
-                'Ocurrences': [value[1] for value in self.output_dict.values()],
-                'Validation Type': [value[3] for value in self.output_dict.values()],
-                'Go To': [f'=HYPERLINK("#\'{key} - {value[0]}\'!A1", "Sample")' for key, value in self.output_dict.items()]
-            }
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Summary', index=False, startrow=7, startcol=0)
-
-            wb = writer.book
-            wsheet = writer.sheets['Summary']
+        with xlsxwriter.Workbook(output_folder + self.etailer_name + f'{timestamp}' + '.xlsx', {
+            'constant_memory': True,
+            'use_zip64': True,
+            'nan_inf_to_errors': True,
+            'remove_timezone': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+        }) as wb:
 
             #formatting cells
             cell_format_title = wb.add_format({'bold': True, 'font_color': 'white', 'bg_color': '#2C6DF6', 'border': 1, 'border_color': '#B7DEE8', 'font_name': 'Segoe UI'})
             cell_format_title.set_align('center')
             cell_format = wb.add_format({'border': 1, 'border_color': '#B7DEE8', 'font_size': 12, 'font_name': 'Segoe UI Semibold', 'font_color': '#2C6DF6'})
+            header_format = wb.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
 
             text_format3 = wb.add_format({'font_size': 12, 'font_name': 'Segoe UI'})
             text_format1 = wb.add_format({'bold': True, 'font_size': 14, 'font_name': 'Segoe UI'})
-            
+        
             green_format = wb.add_format({'align': 'center', 'italic': True, 'bold': True, 'border': 1, 'font_color': 'white', 'border_color': '#B7DEE8', 'font_name': 'Segoe UI', 'font_size': 10, 'bg_color': '#00B050'})
             red_format = wb.add_format({'align': 'center', 'italic': True, 'bold': True, 'border': 1, 'font_color': 'white', 'border_color': '#B7DEE8', 'font_name': 'Segoe UI', 'font_size': 10, 'bg_color': '#FF0000'})
             yellow_format = wb.add_format({'align': 'center', 'italic': True, 'bold': True, 'border': 1, 'font_color': 'white', 'border_color': '#B7DEE8', 'font_name': 'Segoe UI', 'font_size': 10, 'bg_color': '#7030A0'})
 
             sample_format = wb.add_format({'font_color': '#538DD5','underline':  1,'font_size':  10,'align':'center','italic':True,'border':1,'border_color':'#B7DEE8','font_name':'Segoe UI'})
 
+            type_formats = {
+                'Error': red_format,
+                'Consistency': green_format,
+                'Conformity': green_format,
+                'Completeness': green_format,
+                'Compliance': green_format,
+                'Info': yellow_format
+            }
+
+            summary_data = {
+                'INDEX': range(len(self._names)),
+                'Validation': self._names,
+                'Ocurrences': self._counts,
+                'Validation Type': self._types,
+                'Go To': [f'=HYPERLINK("#\'{index} - {name}\'!A1", "Sample")' for index, name in enumerate(self._names)]
+            }
+            summary_df = pd.DataFrame(summary_data)
+
+            # constant_memory mode flushes each row once the next one starts, so every sheet is written top to bottom
+            wsheet = wb.add_worksheet('Summary')
+
             # add information
             wsheet.hide_gridlines(2)
             wsheet.write(1, 0, 'eDive Report', text_format1) 
             wsheet.write(2, 0, f'name:  {self.etailer_name.lower()}', text_format3) 
             wsheet.write(3, 0, f'User: {Configs.user}')  
 
-            #conditional formatting
-            wsheet.conditional_format('D1:D1048576', {'type': 'cell', 'criteria': '==', 'value': '"Error"', 'format': red_format})
-            wsheet.conditional_format('D1:D1048576', {'type': 'cell', 'criteria': '==', 'value': '"Consistency"', 'format': green_format})
-            wsheet.conditional_format('D1:D1048576', {'type': 'cell', 'criteria': '==', 'value': '"Conformity"', 'format': green_format})
-            wsheet.conditional_format('D1:D1048576', {'type': 'cell', 'criteria': '==', 'value': '"Completeness"', 'format': green_format})
-            wsheet.conditional_format('D1:D1048576', {'type': 'cell', 'criteria': '==', 'value': '"Compliance"', 'format': green_format})
-            wsheet.conditional_format('D1:D1048576', {'type': 'cell', 'criteria': '==', 'value': '"Info"', 'format': yellow_format})
-
+            # longest value of each column, measured with vectorized string lengths
+            max_lens = summary_df.astype('string').agg(lambda col: col.str.len().max()).fillna(0)
             for col_num, col in enumerate(summary_df.columns):
-                max_len = max(summary_df[col].astype(str).map(len).max(), len(col)) + 2  # extra space
+                max_len = max(int(max_lens[col]), len(col)) + 2  # extra space
                 wsheet.set_column(col_num, col_num, max_len)  # startcol=0 adjust
 
             # write headers with formatting
-            for col_num, value in enumerate(summary_df.columns.values):
-                wsheet.write(7, col_num, value, cell_format_title)
-
-            # write data with formatting
-            for row_num in range(8, 8 + len(summary_df)):
-                for col_num in range(len(summary_df.columns)):
-                    cell_value = summary_df.iloc[row_num - 8, col_num]
-                    if isinstance(cell_value, (int, float, str)):
-                        wsheet.write(row_num, col_num, cell_value, cell_format)
-                    else:
-                        wsheet.write(row_num, col_num, str(cell_value), cell_format)
-
-            for key, value in self.output_dict.items():
-                sheet_name = f'{key} - {value[0]}'
-                if isinstance(value[2], pd.DataFrame):
-                    value[2].to_excel(writer, sheet_name=sheet_name)
-                else:
-                    error_df = pd.DataFrame({'Error': [value[2]]})
-                    error_df.to_excel(writer, sheet_name=sheet_name)
-
-            for sheet_name in writer.sheets:
-                if sheet_name != 'Summary':
-                    worksheet = writer.sheets[sheet_name]
-                    worksheet.write_url('A1', "internal:'Summary'!A1", string='Back to Summary', cell_format=cell_format_title)
+            wsheet.write_row(7, 0, summary_df.columns, cell_format_title)
+
+            # write data with formatting, one row at a time (missing values as empty cells);
+            # the validation type cell takes the colour of its type
+            summary_values = summary_df.astype(object).where(summary_df.notna(), '')
+            for row_num, row in enumerate(summary_values.itertuples(index=False, name=None), start=8):
+                wsheet.write_row(row_num, 0, row[:3], cell_format)
+                wsheet.write(row_num, 3, row[3], type_formats.get(row[3], cell_format))
+                wsheet.write(row_num, 4, row[4], cell_format)
+
+            for index, (name, payload) in enumerate(zip(self._names, self._payloads)):
+                worksheet = wb.add_worksheet(f'{index} - {name}')
+                for value_type in TEXT_FALLBACK_TYPES:
+                    worksheet.add_write_handler(value_type, write_as_text)
+                if not isinstance(payload, pd.DataFrame):
+                    payload = pd.DataFrame({'Error': [payload]})
+
+                worksheet.write_url('A1', "internal:'Summary'!A1", string='Back to Summary', cell_format=cell_format_title)
+                worksheet.write_row(1, 0, payload.columns, header_format)
+
+                # rows are converted to plain Python values one block at a time (missing values as empty cells)
+                for start in range(0, len(payload), SHEET_BLOCK_SIZE):
+                    block = payload.iloc[start:start + SHEET_BLOCK_SIZE]
+                    block = block.astype(object).where(block.notna(), None)
+                    for row_num, row in enumerate(block.itertuples(index=False, name=None), start=start + 2):
+                        worksheet.write_row(row_num, 0, row)
 
 
 class Validations_API:
@@ -207,7 +258,7 @@ class Validations_API:
         This constructor sets up the initial state of the class, including:
         - Storing the raw DataFrame and file path.
         - Extracting the e-tailer name from the file path.
-        - Initializing an empty dictionary to store validation outputs.
+        - Initializing the empty result lists (names, occurrences, payloads and types) of the validations.
         - Keeping a copy of the raw data for reference.
         - Automatically triggering the execution of validation methods.
 
@@ -221,8 +272,11 @@ class Validations_API:
 
         self.df = df
         self.file_path = file_path
-        self.etailer_name = self.file_path.split('/')[-1].split('.')[0]
-        self.output_dict = {}
+        self.etailer_name = PurePath(str(self.file_path)).stem
+        self._names = []
+        self._counts = []
+        self._payloads = []
+        self._types = []
         self.raw_data = df
         self.run_methods()
 
@@ -234,14 +288,14 @@ class Validations_API:
             Execution logic:
             - Retrieves the raw transaction data stored in `self.raw_data`.
             - Defines a list of validation methods to be executed in order.
-            - Iterates through each method, applying it to the raw data.
-            - If a method raises an exception during execution, the error is captured and stored in `self.output_dict` with relevant metadata.
-            - After all methods are executed, the output dictionary is sorted by index for organized reporting.
+            - Submits each method to a thread pool, applying it to the raw data; each method only reads the data and returns its `(name, occurrences, payload, validation type)` result.
+            - If a method raises an exception during execution, the error is captured with relevant metadata instead.
+            - The futures are collected in submission order and appended to the result lists, so they follow the method list for reporting without any sorting.
 
             This method serves as the central runner for all data validation checks, ensuring consistency and completeness across the dataset.
 
             Returns:
-                None: All validation results and errors are stored in `self.output_dict`.
+                None: All validation results and errors are stored in `self._names`, `self._counts`, `self._payloads` and `self._types`.
             """
 
 
@@ -278,17 +332,22 @@ class Validations_API:
                 self.marketplace_analysis
             ]
 
-            for index, method in enumerate(methods, start=0):
-                try:
-                    method(df_raw)
-                except Exception as e:
-                    self.output_dict[index] = [method.__name__, df_raw.shape[0], str(e), 'Error']
-            self.output_dict = dict(sorted(self.output_dict.items())) 
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = [(method, executor.submit(method, df_raw)) for method in methods]
+                for method, future in futures:
+                    try:
+                        name, count, payload, vtype = future.result()
+                    except Exception as e:
+                        name, count, payload, vtype = method.__name__, df_raw.shape[0], str(e), 'Error'
+                    self._names.append(name)
+                    self._counts.append(count)
+                    self._payloads.append(payload)
+                    self._types.append(vtype)
 
     def export_to_excel(self) -> None:
 
         """
-        Exports the validation results stored in `self.output_dict` to a formatted Excel file.
+        Exports the validation results stored in the result lists to a formatted Excel file.
 
         Export logic:
         - Creates an Excel file named using the etailer name and timestamp.
@@ -298,9 +357,10 @@ class Validations_API:
             3. Number of occurrences
             4. Validation types
             5. Hyperlinks to individual validation sheets
-        - Applies custom formatting to headers, cells, and conditional formatting based on validation type.
-        - Writes individual sheets for each validation, including either the DataFrame output or error message.
-        - Adds a "Back to Summary" link on each sheet for easy navigation.
+        - Applies custom formatting to headers and cells, colouring each validation type cell by its type.
+        - Writes every sheet row by row in xlsxwriter's constant_memory mode, so memory stays flat regardless of payload size.
+        - Writes individual sheets for each validation, including either the DataFrame output (without its index) or error message.
+        - Adds a "Back to Summary" link above the table on each sheet for easy navigation.
 
         This method provides a structured and visually enhanced Excel report for reviewing validation results.
 
@@ -308,74 +368,86 @@ class Validations_API:
             None: The Excel file is saved to the specified output folder.
         """
 
-        with pd.ExcelWriter(output_folder + self.etailer_name + f'{timestamp}' + '.xlsx', engine='xlsxwriter') as writer:
-            summary_data = {
-                'INDEX': list(self.output_dict.keys()),
-                'Validation': [value[0] for value in self.output_dict.values()],
-                'Ocurrences': [value[1] for value in self.output_dict.values()],
-                'Validation Type': [value[3] for value in self.output_dict.values()],
-                'Go To': [f'=HYPERLINK("#\'{key} - {value[0]}\'!A1", "Sample")' for key, value in self.output_dict.items()]
-            }
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Summary', index=False, startrow=7, startcol=0)
-
-            wb = writer.book
-            wsheet = writer.sheets['Summary']
+        with xlsxwriter.Workbook(output_folder + self.etailer_name + f'{timestamp}' + '.xlsx', {
+            'constant_memory': True,
+            'use_zip64': True,
+            'nan_inf_to_errors': True,
+            'remove_timezone': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+        }) as wb:
 
             #formatting cells
             cell_format_title = wb.add_format({'bold': True, 'font_color': 'white', 'bg_color': '#2C6DF6', 'border': 1, 'border_color': '#B7DEE8', 'font_name': 'Segoe UI'})
             cell_format_title.set_align('center')
             cell_format = wb.add_format({'border': 1, 'border_color': '#B7DEE8', 'font_size': 12, 'font_name': 'Segoe UI Semibold', 'font_color': '#2C6DF6'})
+            header_format = wb.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
 
             text_format3 = wb.add_format({'font_size': 12, 'font_name': 'Segoe UI'})
             text_format1 = wb.add_format({'bold': True, 'font_size': 14, 'font_name': 'Segoe UI'})
-            
+        
             green_format = wb.add_format({'align': 'center', 'italic': True, 'bold': True, 'border': 1, 'font_color': 'white', 'border_color': '#B7DEE8', 'font_name': 'Segoe UI', 'font_size': 10, 'bg_color': '#00B050'})
             red_format = wb.add_format({'align': 'center', 'italic': True, 'bold': True, 'border': 1, 'font_color': 'white', 'border_color': '#B7DEE8', 'font_name': 'Segoe UI', 'font_size': 10, 'bg_color': '#FF0000'})
             yellow_format = wb.add_format({'align': 'center', 'italic': True, 'bold': True, 'border': 1, 'font_color': 'white', 'border_color': '#B7DEE8', 'font_name': 'Segoe UI', 'font_size': 10, 'bg_color': '#7030A0'})
 
             sample_format = wb.add_format({'font_color': '#538DD5','underline':  1,'font_size':  10,'align':'center','italic':True,'border':1,'border_color':'#B7DEE8','font_name':'Segoe UI'})
 
+            type_formats = {
+                'Error': red_format,
+                'Consistency': green_format,
+                'Conformity': green_format,
+                'Completeness': green_format,
+                'Compliance': green_format,
+                'Info': yellow_format
+            }
+
+            summary_data = {
+                'INDEX': range(len(self._names)),
+                'Validation': self._names,
+                'Ocurrences': self._counts,
+                'Validation Type': self._types,
+                'Go To': [f'=HYPERLINK("#\'{index} - {name}\'!A1", "Sample")' for index, name in enumerate(self._names)]
+            }
+            summary_df = pd.DataFrame(summary_data)
+
+            # constant_memory mode flushes each row once the next one starts, so every sheet is written top to bottom
+            wsheet = wb.add_worksheet('Summary')
+
             # add information
             wsheet.hide_gridlines(2)
             wsheet.write(1, 0, 'eDive Report', text_format1) 
             wsheet.write(2, 0, f'name:  {self.etailer_name.lower()}', text_format3) 
             wsheet.write(3, 0, f'User: {Configs.user}')  
 
-            #conditional formatting
-            wsheet.conditional_format('D1:D1048576', {'type': 'cell', 'criteria': '==', 'value': '"Error"', 'format': red_format})
-            wsheet.conditional_format('D1:D1048576', {'type': 'cell', 'criteria': '==', 'value': '"Consistency"', 'format': green_format})
-            wsheet.conditional_format('D1:D1048576', {'type': 'cell', 'criteria': '==', 'value': '"Conformity"', 'format': green_format})
-            wsheet.conditional_format('D1:D1048576', {'type': 'cell', 'criteria': '==', 'value': '"Completeness"', 'format': green_format})
-            wsheet.conditional_format('D1:D1048576', {'type': 'cell', 'criteria': '==', 'value': '"Compliance"', 'format': green_format})
-            wsheet.conditional_format('D1:D1048576', {'type': 'cell', 'criteria': '==', 'value': '"Info"', 'format': yellow_format})
-
+            # longest value of each column, measured with vectorized string lengths
+            max_lens = summary_df.astype('string').agg(lambda col: col.str.len().max()).fillna(0)
             for col_num, col in enumerate(summary_df.columns):
-                max_len = max(summary_df[col].astype(str).map(len).max(), len(col)) + 2  # extra space
+                max_len = max(int(max_lens[col]), len(col)) + 2  # extra space
                 wsheet.set_column(col_num, col_num, max_len)  # startcol=0 adjust
 
             # write headers with formatting
-            for col_num, value in enumerate(summary_df.columns.values):
-                wsheet.write(7, col_num, value, cell_format_title)
-
-            # write data with formatting
-            for row_num in range(8, 8 + len(summary_df)):
-                for col_num in range(len(summary_df.columns)):
-                    cell_value = summary_df.iloc[row_num - 8, col_num]
-                    if isinstance(cell_value, (int, float, str)):
-                        wsheet.write(row_num, col_num, cell_value, cell_format)
-                    else:
-                        wsheet.write(row_num, col_num, str(cell_value), cell_format)
-
-            for key, value in self.output_dict.items():
-                sheet_name = f'{key} - {value[0]}'
-                if isinstance(value[2], pd.DataFrame):
-                    value[2].to_excel(writer, sheet_name=sheet_name)
-                else:
-                    error_df = pd.DataFrame({'Error': [value[2]]})
-                    error_df.to_excel(writer, sheet_name=sheet_name)
-
-            for sheet_name in writer.sheets:
-                if sheet_name != 'Summary':
-                    worksheet = writer.sheets[sheet_name]
-                    worksheet.write_url('A1', "internal:'Summary'!A1", string='Back to Summary', cell_format=cell_format_title)
\ No newline at end of file
+            wsheet.write_row(7, 0, summary_df.columns, cell_format_title)
+
+            # write data with formatting, one row at a time (missing values as empty cells);
+            # the validation type cell takes the colour of its type
+            summary_values = summary_df.astype(object).where(summary_df.notna(), '')
+            for row_num, row in enumerate(summary_values.itertuples(index=False, name=None), start=8):
+                wsheet.write_row(row_num, 0, row[:3], cell_format)
+                wsheet.write(row_num, 3, row[3], type_formats.get(row[3], cell_format))
+                wsheet.write(row_num, 4, row[4], cell_format)
+
+            for index, (name, payload) in enumerate(zip(self._names, self._payloads)):
+                worksheet = wb.add_worksheet(f'{index} - {name}')
+                for value_type in TEXT_FALLBACK_TYPES:
+                    worksheet.add_write_handler(value_type, write_as_text)
+                if not isinstance(payload, pd.DataFrame):
+                    payload = pd.DataFrame({'Error': [payload]})
+
+                worksheet.write_url('A1', "internal:'Summary'!A1", string='Back to Summary', cell_format=cell_format_title)
+                worksheet.write_row(1, 0, payload.columns, header_format)
+
+                # rows are converted to plain Python values one block at a time (missing values as empty cells)
+                for start in range(0, len(payload), SHEET_BLOCK_SIZE):
+                    block = payload.iloc[start:start + SHEET_BLOCK_SIZE]
+                    block = block.astype(object).where(block.notna(), None)
+                    for row_num, row in enumerate(block.itertuples(index=False, name=None), start=start + 2):
+                        worksheet.write_row(row_num, 0, row)
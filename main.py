@@ -1,12 +1,12 @@
 from Cleaning.cleaning import *
 from Validations.validations import *
-from tkinter.filedialog import askopenfile 
+from tkinter.filedialog import askopenfilename
 
-file_path = askopenfile()
+file_path = askopenfilename()
 DataPross = DataProcessor(file_path)
 
 df = DataPross.process_file()
-DataProcessor.get_file_type(df=df)
+DataPross.get_file_type(df=df)
 
 
 if DataPross.file_type == "API":
@@ -0,0 +1,103 @@
+import json
+
+import openpyxl
+import pytest
+import pandas as pd
+
+from Cleaning.cleaning import DataProcessor
+
+
+def write_tag_csv(tmp_path):
+    path = tmp_path / 'etailer.csv'
+    path.write_text(
+        'id_log,zipcode,ean,totalspent,datacomp\n'
+        '007,01234,0789123456789,10.5,2024-01-05\n'
+        '008,00001,0000000000017,,2024-01-05 13:22:10\n'
+    )
+    return str(path)
+
+
+def test_process_file_keeps_leading_zeros_in_text_columns(tmp_path):
+    df = DataProcessor(write_tag_csv(tmp_path)).process_file()
+
+    assert df['zipcode'].tolist() == ['01234', '00001']
+    assert df['ean'].tolist() == ['0789123456789', '0000000000017']
+    assert df['id_log'].tolist() == ['007', '008']
+
+
+def test_process_file_stream_keeps_leading_zeros_in_text_columns(tmp_path):
+    df = pd.concat(DataProcessor(write_tag_csv(tmp_path)).process_file(stream=True))
+
+    assert df['zipcode'].tolist() == ['01234', '00001']
+
+
+def test_get_converters_returns_read_only_schema():
+    converters = DataProcessor('etailer.csv').get_converters('TAG')
+
+    with pytest.raises(TypeError):
+        converters['zipcode'] = float
+    assert DataProcessor('etailer.csv').get_converters('TAG')['zipcode'] is str
+
+
+def test_process_file_reads_mixed_number_and_text_excel_columns_as_text(tmp_path):
+    path = tmp_path / 'etailer.xlsx'
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(['id_log', 'zipcode', 'totalspent'])
+    ws.append([7, 1234, 10.5])
+    ws.append(['008', '01234-000', 3])
+    wb.save(path)
+
+    df = DataProcessor(str(path)).process_file()
+
+    assert df['id_log'].tolist() == ['7', '008']
+    assert df['zipcode'].tolist() == ['1234', '01234-000']
+    assert df['totalspent'].tolist() == [10.5, 3.0]
+
+
+def test_process_file_types_text_columns_alike_for_csv_and_excel(tmp_path):
+    xlsx_path = tmp_path / 'etailer.xlsx'
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(['id_log', 'zipcode', 'ean', 'totalspent', 'datacomp'])
+    ws.append(['007', '01234', '0789123456789', 10.5, '2024-01-05'])
+    wb.save(xlsx_path)
+
+    csv_df = DataProcessor(write_tag_csv(tmp_path)).process_file()
+    excel_df = DataProcessor(str(xlsx_path)).process_file()
+
+    for col in ['id_log', 'zipcode', 'ean']:
+        assert csv_df[col].dtype == pd.StringDtype('pyarrow')
+        assert excel_df[col].dtype == pd.StringDtype('pyarrow')
+    assert csv_df['totalspent'].dtype == excel_df['totalspent'].dtype == 'float64'
+
+
+def test_process_file_keeps_json_numbers_in_text_columns_with_nulls(tmp_path):
+    path = tmp_path / 'etailer.json'
+    path.write_text(json.dumps([
+        {'id_log': 7, 'zipcode': 1234, 'totalspent': 10.5},
+        {'id_log': '008', 'zipcode': None, 'totalspent': None},
+    ]))
+
+    df = DataProcessor(str(path)).process_file()
+
+    assert df['zipcode'].tolist() == ['1234', pd.NA]
+    assert df['id_log'].tolist() == ['7', '008']
+    assert df['totalspent'].dtype == 'float64'
+
+
+def test_process_file_reads_xml_rows_with_missing_fields(tmp_path):
+    path = tmp_path / 'etailer.xml'
+    path.write_text(
+        '<rows>'
+        '<row><id_log>007</id_log><zipcode>01234</zipcode></row>'
+        '<row><zipcode></zipcode><productname>TV</productname></row>'
+        '</rows>'
+    )
+
+    df = DataProcessor(str(path)).process_file()
+
+    assert list(df.columns) == ['id_log', 'zipcode', 'productname']
+    assert df['id_log'].tolist() == ['007', None]
+    assert df['zipcode'].tolist() == ['01234', None]
+    assert df['productname'].tolist() == [None, 'TV']